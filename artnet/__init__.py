@@ -3,9 +3,15 @@ __all__ = [
     "DEFAULT_FPS",
     "ArtNet",
     "ArtNetCallback",
+    "Discovery",
+    "LatencyTrace",
+    "PacedSender",
     "TriggerKey",
     "OpCode",
 ]
 
 from .artnet import ART_NET_PORT, DEFAULT_FPS, ArtNet, ArtNetCallback, TriggerKey
+from .discovery import Discovery
+from .pacing import PacedSender
+from .timing import LatencyTrace
 from .helper import OpCode
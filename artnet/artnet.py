@@ -1,9 +1,11 @@
 import socket
+import time
 from enum import IntEnum
 from typing import Callable
 
 from .helper import (
     ARTNET_REPLY_PARSER,
+    POLL_FLAG_TARGETED_MODE,
     OpCode,
     parse_header,
     pack_address,
@@ -14,6 +16,7 @@ from .helper import (
     pack_sync,
     pack_trigger,
 )
+from .timing import LatencyTrace, enable_timestamps, recv_timestamped
 
 ART_NET_PORT = 6454
 
@@ -33,7 +36,23 @@ ArtNetCallback = Callable[[OpCode, str, int, any], None]
 
 
 class ArtNet:
-    def __init__(self, ip: str = "<broadcast>", port: int = ART_NET_PORT) -> None:
+    def __init__(
+        self,
+        ip: str = "<broadcast>",
+        port: int = ART_NET_PORT,
+        suppress_duplicates: bool = False,
+        max_silence: float | None = None,
+        timestamps: bool = False,
+    ) -> None:
+        """
+        :param suppress_duplicates: Drop incoming ArtDmx/ArtNzs frames whose
+            payload equals the last one delivered for the same source and universe.
+        :param max_silence: Deliver an unchanged frame anyway if nothing was
+            delivered for this many seconds. None never refreshes.
+        :param timestamps: Read kernel receive timestamps (SO_TIMESTAMPNS), add
+            them as "Timestamp" (ns, None if missing) to every delivered packet
+            and record the latency of each receive stage in `trace`.
+        """
         self.address = (ip, port)
 
         # Create a UDP socket
@@ -41,6 +60,18 @@ class ArtNet:
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
 
         self.register: dict[OpCode, ArtNetCallback] = {}
+        self.bound = False
+
+        self.suppress_duplicates = suppress_duplicates
+        self.max_silence = max_silence
+        self.suppressed_frames = 0
+        # (op_code, ip, port, universe) -> (payload, time of last delivery)
+        self._last_frames: dict[tuple, tuple[bytes, float]] = {}
+
+        self.trace: LatencyTrace | None = None
+        if timestamps:
+            enable_timestamps(self.sock)
+            self.trace = LatencyTrace()
 
     def __del__(self) -> None:
         self.sock.close()
@@ -60,9 +91,44 @@ class ArtNet:
         if op_code in self.register:
             del self.register[op_code]
 
+    def _is_duplicate(
+        self, op_code: OpCode, addr: tuple[str, int], data: bytes
+    ) -> bool:
+        """
+        Check an ArtDmx/ArtNzs datagram against the last frame delivered from the
+        same source and universe, remember it and count it if suppressed.
+        Only the raw bytes are compared. The sequence and the ArtDmx physical port
+        are ignored, the ArtNzs start code is compared as it defines the meaning
+        of the data.
+        """
+        if op_code not in (OpCode.ArtDmx, OpCode.ArtNzs) or len(data) < 18:
+            return False
+
+        # Universe (14:16), length (16:18) and DMX data (18:)
+        payload = bytes(data[16:])
+        key = (op_code, *addr, data[14:16])
+        if op_code == OpCode.ArtNzs:
+            # Start code (13)
+            key += (data[13],)
+        now = time.monotonic()
+
+        last = self._last_frames.get(key)
+        if last is not None and last[0] == payload:
+            if self.max_silence is None or now - last[1] < self.max_silence:
+                self.suppressed_frames += 1
+                return True
+
+        self._last_frames[key] = (payload, now)
+        return False
+
     def receive(self, buffer_size: int = 1024) -> None:
         # Buffer size of 1024 bytes
-        data, addr = self.sock.recvfrom(buffer_size)
+        if self.trace is None:
+            data, addr = self.sock.recvfrom(buffer_size)
+        else:
+            data, addr, timestamp = recv_timestamped(self.sock, buffer_size)
+            parse_start = time.time_ns()
+
         op_code = parse_header(data)
         if op_code is not None:
             parser = ARTNET_REPLY_PARSER.get(op_code, lambda x: x)
@@ -71,16 +137,35 @@ class ArtNet:
             if subscriber is None:
                 return
 
+            if self.suppress_duplicates and self._is_duplicate(op_code, addr, data):
+                return
+
             reply = parser(data)
             if reply is None:
                 return
 
+            if self.trace is None:
+                subscriber(op_code, *addr, reply)
+                return
+
+            # None if the kernel attached no timestamp
+            if isinstance(reply, dict):
+                reply["Timestamp"] = timestamp
+
+            dispatch = time.time_ns()
             subscriber(op_code, *addr, reply)
+            self.trace.record(timestamp, parse_start, dispatch, time.time_ns())
+
+    def bind(self) -> None:
+        """Bind the socket to the ArtNet port, if not done yet."""
+        if not self.bound:
+            self.sock.bind(("", ART_NET_PORT))
+            self.bound = True
 
     def listen(self, timeout: float | None = 3.0) -> None:
         """Listens for any incoming ArtNet packages."""
 
-        self.sock.bind(("", ART_NET_PORT))
+        self.bind()
         self.sock.settimeout(timeout)
 
         try:
@@ -90,14 +175,31 @@ class ArtNet:
         except socket.timeout:
             pass
 
-    def send_poll(self) -> None:
-        """Send an ArtPoll packet."""
-
-        self.sock.sendto(pack_poll(), self.address)
-
-    def send_dmx(self, universe15bit: int, seq: int, dmx_data: bytearray) -> None:
-        """Send an ArtDmx packet."""
-        self.sock.sendto(pack_dmx(universe15bit, seq, dmx_data), self.address)
+    def send_poll(
+        self, target_port_bottom: int | None = None, target_port_top: int | None = None
+    ) -> None:
+        """
+        Send an ArtPoll packet.
+        If a Port-Address range is given, Targeted Mode is enabled and only nodes
+        with a port inside the range reply.
+        """
+        if target_port_bottom is None or target_port_top is None:
+            packet = pack_poll()
+        else:
+            packet = pack_poll(
+                flags=POLL_FLAG_TARGETED_MODE,
+                target_port_top=target_port_top,
+                target_port_bottom=target_port_bottom,
+            )
+
+        self.sock.sendto(packet, self.address)
+
+    def send_dmx(
+        self, universe15bit: int, seq: int, dmx_data: bytearray, ip: str | None = None
+    ) -> None:
+        """Send an ArtDmx packet, unicast to `ip` if given."""
+        address = self.address if ip is None else (ip, self.address[1])
+        self.sock.sendto(pack_dmx(universe15bit, seq, dmx_data), address)
 
     def send_nzs(
         self, universe15bit: int, sequence: int, start_code: int, dmx_data: bytearray
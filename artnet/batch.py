@@ -0,0 +1,271 @@
+"""
+Columnar parsing of many captured datagrams at once.
+
+Requires numpy (pip install artnet-python[numpy]).
+"""
+
+from typing import Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .helper import ART_NET_HEADER, OpCode
+
+
+# Fixed numeric fields per OpCode: (name, offset, format)
+# Formats: "u1" single byte, "<u2" / ">u2" little / big endian 16 bit,
+# ">u4" IPv4 address in network byte order
+# Arrays like SwIn[4] are split into numbered columns, text, Mac and variable
+# length data are not included.
+BATCH_FIELDS: dict[OpCode, list[tuple[str, int, str]]] = {
+    OpCode.ArtPoll: [
+        ("ProtVer", 10, "<u2"),
+        ("Flags", 12, "u1"),
+        ("DiagPriority", 13, "u1"),
+        ("TargetPortTop", 14, ">u2"),
+        ("TargetPortBottom", 16, ">u2"),
+        ("EstaMan", 18, "<u2"),
+        ("Oem", 20, "<u2"),
+    ],
+    OpCode.ArtPollReply: [
+        ("IpAdress", 10, ">u4"),
+        ("PortNumber", 14, "<u2"),
+        ("VersInfo", 16, "<u2"),
+        ("NetSwitch", 18, "u1"),
+        ("SubSwitch", 19, "u1"),
+        ("Oem", 20, "<u2"),
+        ("UbeaVersion", 22, "u1"),
+        ("Status1", 23, "u1"),
+        ("EstaMan", 24, "<u2"),
+        ("NumPorts", 172, "<u2"),
+        ("PortTypes1", 174, "u1"),
+        ("PortTypes2", 175, "u1"),
+        ("PortTypes3", 176, "u1"),
+        ("PortTypes4", 177, "u1"),
+        ("GoodInput1", 178, "u1"),
+        ("GoodInput2", 179, "u1"),
+        ("GoodInput3", 180, "u1"),
+        ("GoodInput4", 181, "u1"),
+        ("GoodOutput1", 182, "u1"),
+        ("GoodOutput2", 183, "u1"),
+        ("GoodOutput3", 184, "u1"),
+        ("GoodOutput4", 185, "u1"),
+        ("SwIn1", 186, "u1"),
+        ("SwIn2", 187, "u1"),
+        ("SwIn3", 188, "u1"),
+        ("SwIn4", 189, "u1"),
+        ("SwOut1", 190, "u1"),
+        ("SwOut2", 191, "u1"),
+        ("SwOut3", 192, "u1"),
+        ("SwOut4", 193, "u1"),
+        ("SwVideo", 194, "u1"),
+        ("SwMacro", 195, "u1"),
+        ("SwRemote", 196, "u1"),
+        ("Style", 200, "u1"),
+        ("BindIp", 207, ">u4"),
+        ("BindIndex", 211, "u1"),
+        ("Status2", 212, "u1"),
+    ],
+    OpCode.ArtDmx: [
+        ("ProtVer", 10, "<u2"),
+        ("Sequence", 12, "u1"),
+        ("Physical", 13, "u1"),
+        ("Universe", 14, "<u2"),
+        ("Length", 16, ">u2"),
+    ],
+    OpCode.ArtNzs: [
+        ("ProtVer", 10, "<u2"),
+        ("Sequence", 12, "u1"),
+        ("StartCode", 13, "u1"),
+        ("Universe", 14, "<u2"),
+        ("Length", 16, ">u2"),
+    ],
+    OpCode.ArtSync: [
+        ("ProtVer", 10, "<u2"),
+        ("Aux1", 12, "u1"),
+        ("Aux2", 13, "u1"),
+    ],
+    OpCode.ArtTrigger: [
+        ("ProtVer", 10, "<u2"),
+        ("Oem", 14, "<u2"),
+        ("Key", 16, "u1"),
+        ("SubKey", 17, "u1"),
+    ],
+    OpCode.ArtIpProg: [
+        ("ProtVer", 10, "<u2"),
+        ("Command", 14, "u1"),
+        ("ProgIp", 16, ">u4"),
+        ("ProgSm", 20, ">u4"),
+        ("ProgPort", 24, "<u2"),
+        ("ProgDg", 26, ">u4"),
+    ],
+    OpCode.ArtIpProgReply: [
+        ("ProtVer", 10, "<u2"),
+        ("ProgIp", 16, ">u4"),
+        ("ProgSm", 20, ">u4"),
+        ("ProgPort", 24, "<u2"),
+        ("Status", 26, "u1"),
+        ("ProgDg", 28, ">u4"),
+    ],
+    OpCode.ArtAddress: [
+        ("ProtVer", 10, "<u2"),
+        ("NetSwitch", 12, "u1"),
+        ("BindIndex", 13, "u1"),
+        ("SwIn1", 96, "u1"),
+        ("SwIn2", 97, "u1"),
+        ("SwIn3", 98, "u1"),
+        ("SwIn4", 99, "u1"),
+        ("SwOut1", 100, "u1"),
+        ("SwOut2", 101, "u1"),
+        ("SwOut3", 102, "u1"),
+        ("SwOut4", 103, "u1"),
+        ("SubSwitch", 104, "u1"),
+        ("AcnPriority", 105, "u1"),
+        ("Command", 106, "u1"),
+    ],
+    OpCode.ArtCommand: [
+        ("ProtVer", 10, "<u2"),
+        ("EstaMan", 12, "<u2"),
+        ("Length", 14, "<u2"),
+    ],
+}
+
+# Minimum datagram length per OpCode, as required by the single packet parsers
+BATCH_MIN_LENGTH = {
+    OpCode.ArtPoll: 22,
+    OpCode.ArtPollReply: 239,
+    OpCode.ArtTrigger: 18,
+    OpCode.ArtDmx: 18,
+    OpCode.ArtNzs: 18,
+    OpCode.ArtSync: 14,
+    OpCode.ArtIpProg: 32,
+    OpCode.ArtIpProgReply: 34,
+    OpCode.ArtAddress: 107,
+    OpCode.ArtCommand: 16,
+}
+
+# Format -> (width in bytes, column dtype)
+BATCH_FORMATS = {
+    "u1": (1, np.uint8),
+    "<u2": (2, np.uint16),
+    ">u2": (2, np.uint16),
+    ">u4": (4, np.uint32),
+}
+
+# OpCodes with DMX data starting at byte 18
+BATCH_PAYLOAD = (OpCode.ArtDmx, OpCode.ArtNzs)
+
+DMX_DATA_OFFSET = 18
+DMX_DATA_SIZE = 512
+
+# Packets per block when clearing DMX data beyond Length
+BATCH_CHUNK = 16384
+
+
+def _concatenate(
+    buffers: Sequence[bytes] | bytes, offsets: Sequence[int] | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # The raw buffer is zero padded by DMX_DATA_SIZE bytes, so a full DMX slot
+    # can be viewed at every datagram start
+    padding = bytes(DMX_DATA_SIZE)
+
+    if isinstance(buffers, (bytes, bytearray, memoryview)):
+        if offsets is None:
+            raise ValueError("Offsets are required for a concatenated buffer")
+        raw = np.frombuffer(bytes(buffers) + padding, dtype=np.uint8)
+        starts = np.asarray(offsets, dtype=np.intp)
+        ends = np.append(starts[1:], raw.size - DMX_DATA_SIZE)
+    else:
+        lengths = np.fromiter(map(len, buffers), dtype=np.intp, count=len(buffers))
+        raw = np.frombuffer(b"".join([*buffers, padding]), dtype=np.uint8)
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+
+    return raw, starts, ends - starts
+
+
+def _gather(raw: np.ndarray, starts: np.ndarray, offset: int, fmt: str) -> np.ndarray:
+    low = raw[starts + offset]
+    if fmt == "u1":
+        return low
+
+    if fmt == ">u4":
+        value = np.zeros(starts.size, dtype=np.uint32)
+        for i in range(4):
+            value = value << 8 | raw[starts + offset + i]
+        return value
+
+    high = raw[starts + offset + 1]
+    if fmt == "<u2":
+        return low.astype(np.uint16) | high.astype(np.uint16) << 8
+    return low.astype(np.uint16) << 8 | high.astype(np.uint16)
+
+
+def parse_batch(
+    buffers: Sequence[bytes] | bytes, offsets: Sequence[int] | None = None
+) -> dict[OpCode, dict[str, np.ndarray]]:
+    """
+    Parse many datagrams into columnar arrays, grouped by OpCode.
+
+    :param buffers: A sequence of datagrams, or one concatenated buffer.
+    :param offsets: Start of each datagram if a concatenated buffer is given.
+    :return: Per OpCode a dict with
+        - "Fields": structured array with the packet index and the fixed numeric
+          fields of BATCH_FIELDS,
+        - "Data": (n, 512) uint8 array of zero padded DMX data (ArtDmx, ArtNzs).
+    Packets shorter than the single packet parsers accept are skipped.
+    """
+    raw, starts, lengths = _concatenate(buffers, offsets)
+    # Row i views the DMX_DATA_SIZE bytes starting at raw[i], without copying
+    windows = sliding_window_view(raw, DMX_DATA_SIZE)
+
+    # Header and OpCode
+    header = np.frombuffer(ART_NET_HEADER, dtype=np.uint8)
+    valid = np.flatnonzero(lengths >= 10)
+    heads = windows[starts[valid], : len(header)]
+    valid = valid[(heads == header).all(axis=1)]
+    op_codes = _gather(raw, starts[valid], 8, "<u2")
+
+    result = {}
+    for op_code in OpCode:
+        index = valid[op_codes == op_code]
+        fields = BATCH_FIELDS.get(op_code, [])
+
+        # Minimum length to hold all fixed fields
+        size = max(
+            [BATCH_MIN_LENGTH.get(op_code, 10)]
+            + [o + BATCH_FORMATS[f][0] for _, o, f in fields]
+        )
+        index = index[lengths[index] >= size]
+        if index.size == 0:
+            continue
+
+        dtype = [("Index", np.int64)] + [
+            (name, BATCH_FORMATS[fmt][1]) for name, _, fmt in fields
+        ]
+        columns = np.empty(index.size, dtype=dtype)
+        columns["Index"] = index
+        for name, offset, fmt in fields:
+            columns[name] = _gather(raw, starts[index], offset, fmt)
+
+        entry = dict(Fields=columns)
+
+        if op_code in BATCH_PAYLOAD:
+            # Data ends at the datagram end or at Length, whichever comes first
+            count = np.minimum(
+                lengths[index] - DMX_DATA_OFFSET,
+                np.minimum(columns["Length"], DMX_DATA_SIZE),
+            )
+            data = windows[starts[index] + DMX_DATA_OFFSET]
+
+            # Clear bytes of following datagrams, in blocks to bound the mask size
+            channels = np.arange(DMX_DATA_SIZE)
+            for i in range(0, index.size, BATCH_CHUNK):
+                block = data[i : i + BATCH_CHUNK]
+                block[channels >= count[i : i + BATCH_CHUNK, None]] = 0
+
+            entry["Data"] = data
+
+        result[op_code] = entry
+
+    return result
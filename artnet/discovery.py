@@ -0,0 +1,166 @@
+import socket
+import time
+
+from .artnet import ArtNet
+from .helper import ArtNetFieldDict, OpCode
+
+
+MAX_PORT_ADDRESS = 0x7FFF
+
+
+class Discovery:
+    """
+    Partitioned node discovery using Art-Net 4 Targeted Mode.
+
+    Instead of a single broadcast ArtPoll that makes every node reply at once,
+    the Port-Address space is polled in slices, spaced to avoid reply storms.
+    A slice that gets more than `max_replies` replies, or still yields new nodes
+    when polled again, is split in halves and polled again. Empty slices let the
+    next slice grow, a slice with nodes resets it to `slice_size`.
+    """
+
+    def __init__(
+        self,
+        artnet: ArtNet,
+        slice_size: int = 32,
+        max_slice_size: int = 4096,
+        max_replies: int = 32,
+        interval: float = 0.05,
+        reply_timeout: float = 1.0,
+        quiet_time: float = 0.3,
+        max_polls: int = 3,
+        port_bottom: int = 0,
+        port_top: int = MAX_PORT_ADDRESS,
+    ) -> None:
+        """
+        :param artnet: The ArtNet instance used to send polls and receive replies.
+        :param slice_size: Number of Port-Addresses targeted by one poll.
+        :param max_slice_size: Upper bound for slices grown over empty ranges.
+        :param max_replies: A slice with more replies than this is split.
+        :param interval: Pause in seconds between two polls.
+        :param reply_timeout: Time to wait for the first reply to a poll.
+        :param quiet_time: A poll is finished if no new reply arrived for this long.
+        :param max_polls: Maximum number of polls per slice.
+        :param port_bottom: Lowest Port-Address to discover.
+        :param port_top: Highest Port-Address to discover.
+        """
+        if not (1 <= slice_size <= max_slice_size):
+            raise ValueError("Slice size must be between 1 and the max slice size")
+        if not (0 <= port_bottom <= port_top <= MAX_PORT_ADDRESS):
+            raise ValueError("Port-Address range must be within 0 and 32767")
+
+        self.artnet = artnet
+        self.slice_size = slice_size
+        self.max_slice_size = max_slice_size
+        self.max_replies = max_replies
+        self.interval = interval
+        self.reply_timeout = reply_timeout
+        self.quiet_time = quiet_time
+        self.max_polls = max_polls
+        self.port_bottom = port_bottom
+        self.port_top = port_top
+
+        # (ip, BindIndex) -> ArtPollReply
+        self.nodes: dict[tuple[str, int], ArtNetFieldDict] = {}
+        self._replies = 0
+        self._new_replies = 0
+
+    def _on_reply(self, op_code: OpCode, ip: str, port: int, reply: dict) -> None:
+        key = (ip, reply["BindIndex"])
+        if key not in self.nodes:
+            self._new_replies += 1
+        self._replies += 1
+        self.nodes[key] = reply
+
+    def poll_range(self, bottom: int, top: int) -> tuple[int, int]:
+        """
+        Poll one Port-Address range. Waits up to `reply_timeout` seconds for the
+        first reply, then collects replies until no new one arrived for
+        `quiet_time` seconds.
+        :return: The number of replies and of new nodes.
+        """
+        self._replies = 0
+        self._new_replies = 0
+        self.artnet.send_poll(bottom, top)
+
+        seen = 0
+        deadline = time.monotonic() + self.reply_timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            self.artnet.sock.settimeout(remaining)
+            try:
+                self.artnet.receive()
+            except socket.timeout:
+                break
+
+            if self._new_replies > seen:
+                seen = self._new_replies
+                deadline = time.monotonic() + self.quiet_time
+
+        return self._replies, self._new_replies
+
+    def run(self) -> dict[tuple[str, int], ArtNetFieldDict]:
+        """Discover all nodes in the configured Port-Address range."""
+        self.artnet.bind()
+
+        previous = self.artnet.register.get(OpCode.ArtPollReply)
+        timeout = self.artnet.sock.gettimeout()
+
+        def on_reply(op_code: OpCode, ip: str, port: int, reply: dict) -> None:
+            self._on_reply(op_code, ip, port, reply)
+            if previous is not None:
+                previous(op_code, ip, port, reply)
+
+        self.artnet.subscribe(OpCode.ArtPollReply, on_reply)
+
+        try:
+            self._scan()
+
+        finally:
+            self.artnet.sock.settimeout(timeout)
+            if previous is None:
+                self.artnet.unscubscibe(OpCode.ArtPollReply)
+            else:
+                self.artnet.subscribe(OpCode.ArtPollReply, previous)
+
+        return self.nodes
+
+    def _scan(self) -> None:
+        # Halves of split slices, polled before continuing upwards
+        pending: list[tuple[int, int]] = []
+        bottom = self.port_bottom
+        size = self.slice_size
+        first = True
+
+        while pending or bottom <= self.port_top:
+            fresh = not pending
+            if fresh:
+                low, high = bottom, min(bottom + size - 1, self.port_top)
+                bottom = high + 1
+            else:
+                low, high = pending.pop()
+
+            for polls in range(self.max_polls):
+                if not first:
+                    time.sleep(self.interval)
+                first = False
+
+                replies, new = self.poll_range(low, high)
+                if new == 0:
+                    break
+
+                # Too many nodes at once, or replies still got lost
+                if high > low and (replies > self.max_replies or polls > 0):
+                    middle = (low + high) // 2
+                    pending.extend([(middle + 1, high), (low, middle)])
+                    break
+
+            if not fresh:
+                continue
+            if replies == 0 and polls == 0:
+                size = min(size * 2, self.max_slice_size)
+            else:
+                size = self.slice_size
@@ -0,0 +1,154 @@
+"""
+Vectorized cue fades over the whole rig.
+
+Requires numpy (pip install artnet-python[numpy]).
+"""
+
+import time
+from typing import Callable, Sequence
+
+import numpy as np
+
+
+DMX_CHANNELS = 512
+
+
+EASING_CURVES: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "linear": lambda x: x,
+    "sine": lambda x: 0.5 - 0.5 * np.cos(np.pi * x),
+    "ease_in": lambda x: x * x,
+    "ease_out": lambda x: x * (2.0 - x),
+    "snap": lambda x: (x >= 1.0).astype(x.dtype),
+}
+
+
+class FadeEngine:
+    """
+    Cue fade engine working on whole-rig arrays.
+
+    Each channel holds the fade it currently follows (start and target level,
+    start time, delay, fade time and easing curve). Starting a cue takes over
+    the channels the cue contains from the current output, other channels keep
+    following their running fade. A frame is evaluated in one vectorized step.
+    """
+
+    def __init__(
+        self,
+        universes: Sequence[int],
+        channels: int = DMX_CHANNELS,
+        resolution: int = 4096,
+    ) -> None:
+        """
+        :param universes: The 15-bit universes of the rig, in channel order.
+        :param channels: Channels per universe.
+        :param resolution: Samples of the precomputed easing curves.
+        """
+        self.universes = list(universes)
+        self.channels = channels
+        self.size = len(self.universes) * channels
+
+        # Easing curves as lookup tables, indexed by curve id and progress
+        self.curve_ids = {name: i for i, name in enumerate(EASING_CURVES)}
+        samples = np.linspace(0.0, 1.0, resolution, dtype=np.float32)
+        self._lut = np.stack([curve(samples) for curve in EASING_CURVES.values()])
+        self._scale = np.float32(resolution - 1)
+
+        self.cues: dict[str, dict[str, np.ndarray]] = {}
+
+        # Per-channel fade state
+        self._from = np.zeros(self.size, dtype=np.float32)
+        self._delta = np.zeros(self.size, dtype=np.float32)
+        self._start = np.zeros(self.size, dtype=np.float64)
+        self._delay = np.zeros(self.size, dtype=np.float32)
+        self._inv_fade = np.zeros(self.size, dtype=np.float32)
+        self._curve = np.zeros(self.size, dtype=np.intp)
+
+    def channel(self, universe: int, channel: int) -> int:
+        """Rig index of a (1-based) channel in a universe."""
+        return self.universes.index(universe) * self.channels + channel - 1
+
+    def _rig_array(self, values: float | np.ndarray, name: str) -> np.ndarray:
+        array = np.asarray(values, dtype=np.float32)
+        if array.ndim == 0:
+            return np.full(self.size, array, dtype=np.float32)
+        if array.size != self.size:
+            raise ValueError(f"{name} must have {self.size} channels")
+        return array.reshape(self.size)
+
+    def store_cue(
+        self,
+        name: str,
+        levels: np.ndarray,
+        fade: float | np.ndarray = 0.0,
+        delay: float | np.ndarray = 0.0,
+        curve: str = "linear",
+    ) -> None:
+        """
+        Store a cue.
+        :param levels: Levels (0-255) for the whole rig, flat or per universe.
+            NaN marks channels not contained in the cue.
+        :param fade: Fade time in seconds, a scalar or per channel.
+        :param delay: Delay in seconds before the fade starts, a scalar or per
+            channel.
+        :param curve: Name of the easing curve, see EASING_CURVES.
+        """
+        if curve not in self.curve_ids:
+            raise ValueError(f"Unknown curve {curve}")
+
+        levels = self._rig_array(levels, "Levels")
+        fade = self._rig_array(fade, "Fade")
+        if (fade < 0).any():
+            raise ValueError("Fade times must not be negative")
+        delay = self._rig_array(delay, "Delay")
+        if (delay < 0).any():
+            raise ValueError("Delay times must not be negative")
+
+        # Zero fade times jump to the target as soon as the delay has passed
+        inv_fade = np.where(fade > 0, 1.0 / np.maximum(fade, 1e-9), 1e12)
+
+        self.cues[name] = dict(
+            Levels=levels,
+            Mask=~np.isnan(levels),
+            InvFade=inv_fade.astype(np.float32),
+            Delay=delay,
+            Curve=np.full(self.size, self.curve_ids[curve], dtype=np.intp),
+        )
+
+    def go(self, name: str, t: float | None = None) -> None:
+        """Start the fade to a stored cue at time `t` (time.monotonic)."""
+        if t is None:
+            t = time.monotonic()
+
+        cue = self.cues[name]
+        mask = cue["Mask"]
+        current = self.levels(t)
+
+        self._from[mask] = current[mask]
+        self._delta[mask] = cue["Levels"][mask] - current[mask]
+        self._start[mask] = t
+        self._delay[mask] = cue["Delay"][mask]
+        self._inv_fade[mask] = cue["InvFade"][mask]
+        self._curve[mask] = cue["Curve"][mask]
+
+    def levels(self, t: float | None = None) -> np.ndarray:
+        """Levels (0-255, float) of the whole rig at time `t` (time.monotonic)."""
+        if t is None:
+            t = time.monotonic()
+
+        elapsed = (t - self._start).astype(np.float32) - self._delay
+        progress = np.clip(elapsed * self._inv_fade, 0.0, 1.0)
+        index = (progress * self._scale + 0.5).astype(np.intp)
+
+        return self._from + self._delta * self._lut[self._curve, index]
+
+    def render(self, t: float | None = None) -> dict[int, bytes]:
+        """
+        DMX data per 15-bit universe at time `t`, ready for send_dmx.
+        Can be passed to PacedSender.run to output at DEFAULT_FPS.
+        """
+        output = np.rint(self.levels(t)).clip(0, 255).astype(np.uint8)
+        output = output.reshape(len(self.universes), self.channels)
+
+        return {
+            universe: output[i].tobytes() for i, universe in enumerate(self.universes)
+        }
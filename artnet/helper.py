@@ -12,6 +12,10 @@ ART_NET_OEM = struct.pack("<H", 0x00FF)  # OEM code OemUnknown 0x00ff
 ART_NET_ESTA_MAN = struct.pack("<H", 0)  # ESTA Manufacturer code
 
 
+# ArtPoll flags
+POLL_FLAG_TARGETED_MODE = 1 << 5
+
+
 class OpCode(IntEnum):
     ArtPoll = 0x2000
     ArtPollReply = 0x2100
@@ -32,7 +36,11 @@ def is_artnet(data: bytes) -> bool:
 def parse_header(data: bytearray) -> OpCode | None:
     if is_artnet(data) and len(data) >= 10:
         op_code_from_byte = struct.unpack("<H", data[8:10])[0]
-        return OpCode(op_code_from_byte)
+        try:
+            return OpCode(op_code_from_byte)
+        except ValueError:
+            # OpCodes not handled by this library (e.g. ArtDiagData, ArtTimeCode)
+            return None
     else:
         return None
 
@@ -46,8 +54,8 @@ def parse_poll(data: bytes) -> ArtNetFieldDict:
         Flags=[bool(data[12] >> i & 1) for i in range(8)],
         DiagPriority=data[13],
         TargetPort=[
-            struct.unpack("<H", data[16:18])[0],
-            struct.unpack("<H", data[14:16])[0],
+            struct.unpack(">H", data[16:18])[0],
+            struct.unpack(">H", data[14:16])[0],
         ],
         EstaMan=struct.unpack("<H", data[18:20])[0],
         Oem=struct.unpack("<H", data[20:22])[0],
@@ -404,7 +412,12 @@ def pack_address(
     return packet
 
 
-def pack_poll() -> bytes:
+def pack_poll(
+    flags: int = 0,
+    diag_prio: int = 0,
+    target_port_top: int = 0,
+    target_port_bottom: int = 0,
+) -> bytes:
     """
     Bit 0:  deprecated
         1:  0 = Only respond to ArtPoll or ArtAddress
@@ -419,22 +432,25 @@ def pack_poll() -> bytes:
             1 = Enable Targeted Mode
         6-7:Unused, transmit as zero
     """
-    flags = b"\x00"
+    if not (0 <= target_port_bottom <= target_port_top <= 0x7FFF):
+        raise ValueError("Target Port-Address range must be within 0 and 32767")
+
+    flags_byte = struct.pack("<B", flags & 0b111111)
     # The lowest priority of diagnostics message to be sent
-    diag_prio = b"\x00"
+    diag_prio_byte = struct.pack("<B", diag_prio)
     # If Targeted Mode is active
-    # Top of range of Port-Addresses to be tested
-    target_port_address_top = struct.pack("<H", 0)
+    # Top of range of Port-Addresses to be tested (Hi byte first)
+    target_port_address_top = struct.pack(">H", target_port_top)
     # Bottom range
-    target_port_address_bottom = struct.pack("<H", 0)
+    target_port_address_bottom = struct.pack(">H", target_port_bottom)
 
     op_code = struct.pack("<H", OpCode.ArtPoll)
     packet = (
         ART_NET_HEADER
         + op_code
         + ART_NET_VERSION
-        + flags
-        + diag_prio
+        + flags_byte
+        + diag_prio_byte
         + target_port_address_top
         + target_port_address_bottom
         + ART_NET_ESTA_MAN
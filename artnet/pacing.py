@@ -0,0 +1,158 @@
+import time
+from typing import Callable
+
+from .artnet import DEFAULT_FPS, ArtNet
+
+
+class PacedSender:
+    """
+    Transmit scheduler that spreads the ArtDmx datagrams of a frame evenly over
+    the frame interval instead of sending them back-to-back, followed by an
+    ArtSync after the last universe.
+    """
+
+    def __init__(
+        self,
+        artnet: ArtNet,
+        fps: float = DEFAULT_FPS,
+        spread: float = 0.8,
+        routes: dict[int, str] | None = None,
+        sync: bool = True,
+        spin: float = 0.0005,
+        max_burst: int = 1,
+    ) -> None:
+        """
+        :param artnet: The ArtNet instance to send with.
+        :param fps: Frames per second.
+        :param spread: Fraction of the frame interval the datagrams are spread over.
+        :param routes: 15-bit universe -> unicast IP of the node. Universes without
+            a route are sent to the address of `artnet`. Pacing is per destination.
+        :param sync: Send an ArtSync after the last universe of every frame.
+        :param spin: Maximum seconds to busy-wait before a send, the rest is slept.
+            Capped to a quarter of the spacing between two sends.
+        :param max_burst: Maximum datagrams sent per wakeup. After a late wakeup
+            the overdue datagrams are spread over the following wakeups.
+        """
+        if not (0.0 <= spread <= 1.0):
+            raise ValueError("Spread must be between 0 and 1")
+        if max_burst < 1:
+            raise ValueError("Max burst must be at least 1")
+
+        self.artnet = artnet
+        self.interval = 1.0 / fps
+        self.spread = spread
+        self.routes = routes if routes is not None else {}
+        self.sync = sync
+        self.spin = spin
+        self.max_burst = max_burst
+
+        self.sequence: dict[int, int] = {}
+
+    def schedule(self, universes: list[int]) -> list[tuple[float, int, str | None]]:
+        """
+        Send offsets in seconds from the frame start.
+        :return: Sorted list of (offset, universe, ip), ip None for the default.
+        """
+        window = self.interval * self.spread
+
+        destinations: dict[str | None, list[int]] = {}
+        for universe in universes:
+            destinations.setdefault(self.routes.get(universe), []).append(universe)
+
+        # Every destination gets its universes evenly spaced over the window,
+        # shifted by its own phase within that spacing so destinations interleave
+        slots = []
+        for j, (ip, group) in enumerate(destinations.items()):
+            spacing = window / len(group)
+            phase = j * spacing / len(destinations)
+            slots.extend(
+                (phase + i * spacing, universe, ip) for i, universe in enumerate(group)
+            )
+        slots.sort(key=lambda slot: slot[0])
+
+        # Only move sends that collide, to a quarter of the mean spacing
+        gap = window / max(len(slots), 1) / 4
+        for k in range(1, len(slots)):
+            if slots[k][0] < slots[k - 1][0] + gap:
+                slots[k] = (slots[k - 1][0] + gap, *slots[k][1:])
+
+        return slots
+
+    def wait_until(self, deadline: float, spin: float | None = None) -> None:
+        """Sleep until shortly before `deadline` (perf_counter), then spin."""
+        if spin is None:
+            spin = self.spin
+
+        remaining = deadline - time.perf_counter()
+        if remaining > spin:
+            time.sleep(remaining - spin)
+
+        while time.perf_counter() < deadline:
+            pass
+
+    def next_sequence(self, universe: int) -> int:
+        # 1-255, 0 disables sequencing on the receiver
+        seq = self.sequence.get(universe, 0) % 255 + 1
+        self.sequence[universe] = seq
+        return seq
+
+    def send_frame(self, frames: dict[int, bytes], start: float | None = None) -> None:
+        """
+        Send one frame paced over the frame interval.
+        :param frames: 15-bit universe -> DMX data.
+        :param start: Frame start (perf_counter), defaults to now.
+        """
+        if start is None:
+            start = time.perf_counter()
+
+        slots = self.schedule(list(frames))
+
+        # Spin at most a quarter of the mean spacing, the rest of each wait is slept
+        spacing = self.interval * self.spread / max(len(slots), 1)
+        spin = min(self.spin, spacing / 4)
+
+        i = 0
+        wakeup = start
+        while i < len(slots):
+            self.wait_until(max(start + slots[i][0], wakeup), spin)
+            now = time.perf_counter()
+
+            # At most max_burst datagrams per wakeup, a backlog after a late
+            # wakeup is caught up at twice the scheduled rate
+            sent = 0
+            while (
+                i < len(slots) and sent < self.max_burst and start + slots[i][0] <= now
+            ):
+                _, universe, ip = slots[i]
+                self.artnet.send_dmx(
+                    universe, self.next_sequence(universe), frames[universe], ip
+                )
+                i += 1
+                sent += 1
+
+            wakeup = time.perf_counter() + spacing / 2
+
+        if self.sync:
+            self.artnet.send_sync()
+
+    def run(
+        self, render: Callable[[], dict[int, bytes]], frames: int | None = None
+    ) -> None:
+        """
+        Send frames from `render` at a fixed rate.
+        :param frames: Number of frames to send, None runs forever.
+        """
+        start = time.perf_counter()
+        count = 0
+
+        while frames is None or count < frames:
+            self.send_frame(render(), start)
+            count += 1
+
+            start += self.interval
+            # Drop missed frames instead of bursting to catch up
+            now = time.perf_counter()
+            if now > start + self.interval:
+                start = now
+
+            self.wait_until(start)
@@ -0,0 +1,95 @@
+import socket
+import struct
+import sys
+from collections import deque
+
+
+# Usually not exported by the socket module, the fallback value is Linux only
+if hasattr(socket, "SO_TIMESTAMPNS"):
+    SO_TIMESTAMPNS = socket.SO_TIMESTAMPNS
+elif sys.platform.startswith("linux"):
+    SO_TIMESTAMPNS = 35
+else:
+    SO_TIMESTAMPNS = None
+SCM_TIMESTAMPNS = getattr(socket, "SCM_TIMESTAMPNS", SO_TIMESTAMPNS)
+
+# struct timespec: seconds and nanoseconds as native longs
+TIMESPEC = struct.Struct("@ll")
+
+# Stage name -> (start, end) index into a recorded trace
+TRACE_STAGES = {
+    "Queue": (0, 1),  # Kernel receive until parse start
+    "Parse": (1, 2),  # Parse start until dispatch
+    "Callback": (2, 3),  # Dispatch until callback end
+    "Total": (0, 3),  # Kernel receive until callback end
+}
+
+
+def enable_timestamps(sock: socket.socket) -> None:
+    """Let the kernel attach a receive timestamp to every datagram."""
+    if SO_TIMESTAMPNS is None or not hasattr(sock, "recvmsg"):
+        raise NotImplementedError(
+            f"Kernel receive timestamps are not supported on {sys.platform}"
+        )
+
+    sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+
+
+def recv_timestamped(
+    sock: socket.socket, buffer_size: int
+) -> tuple[bytes, tuple[str, int], int | None]:
+    """
+    Receive a datagram together with its kernel receive timestamp in
+    nanoseconds since the epoch (comparable to time.time_ns()).
+    """
+    data, ancdata, _, addr = sock.recvmsg(buffer_size, socket.CMSG_SPACE(TIMESPEC.size))
+
+    for level, kind, value in ancdata:
+        if level == socket.SOL_SOCKET and kind == SCM_TIMESTAMPNS:
+            seconds, nanoseconds = TIMESPEC.unpack(value[: TIMESPEC.size])
+            return data, addr, seconds * 1_000_000_000 + nanoseconds
+
+    return data, addr, None
+
+
+class LatencyTrace:
+    """
+    Ring buffer of per-packet timestamps (ns) for kernel receive, parse start,
+    dispatch and callback end. Packets without a kernel timestamp are kept out
+    of the Queue and Total stages and counted in `missing`.
+    """
+
+    def __init__(self, size: int = 10000) -> None:
+        self.traces: deque[tuple[int | None, int, int, int]] = deque(maxlen=size)
+        self.missing = 0
+
+    def record(self, kernel: int | None, parse: int, dispatch: int, done: int) -> None:
+        if kernel is None:
+            self.missing += 1
+        self.traces.append((kernel, parse, dispatch, done))
+
+    def clear(self) -> None:
+        self.traces.clear()
+        self.missing = 0
+
+    def distribution(
+        self, percentiles: tuple[float, ...] = (50, 90, 99, 100)
+    ) -> dict[str, dict[float, float]]:
+        """
+        Latency distribution per stage in microseconds.
+        :return: Stage name -> {percentile: latency}
+        """
+        result = {}
+        for stage, (start, end) in TRACE_STAGES.items():
+            latencies = sorted(
+                (t[end] - t[start]) / 1000 for t in self.traces if t[start] is not None
+            )
+            if not latencies:
+                continue
+
+            result[stage] = {
+                p: latencies[min(int(p / 100 * len(latencies)), len(latencies) - 1)]
+                for p in percentiles
+            }
+
+        return result
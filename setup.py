@@ -11,4 +11,5 @@ setup(
     ),
     packages=find_packages(),
     install_requires=[],
+    extras_require={"numpy": ["numpy"]},
 )